@@ -39,6 +39,11 @@
  * These checks should be used for internal APIs where error handling is
  * not meaningful.  For error handling see argchk.h.
  *
+ * Only use these checks for argument contracts that the caller must
+ * satisfy.  They may be compiled out with EMBC_DBC_ENABLE, so conditions
+ * that depend on runtime state, such as an exhausted pool, must use
+ * EMBC_ASSERT from assert.h instead.
+ *
  * References include:
  *
  * - http://dbc.rubyforge.org/
@@ -48,6 +53,18 @@
  */
 
 
+#ifndef EMBC_DBC_ENABLE
+/**
+ * @brief Enable design-by-contract checks.
+ *
+ * Set to 0 in embc/config.h to compile out all checks for
+ * performance-critical release builds.  The conditions are then not
+ * evaluated, so they must not have side effects.
+ */
+#define EMBC_DBC_ENABLE 1
+#endif
+
+#if EMBC_DBC_ENABLE
 /**
  * @brief Assert on a design-by-contract condition.
  *
@@ -60,6 +77,12 @@
         embc_fatal(__FILENAME__, __LINE__, (message)); \
     } \
 } while (0);
+#else
+#define EMBC_DBC_ASSERT(condition, message) do { \
+    (void) sizeof(condition); \
+    (void) sizeof(message); \
+} while (0);
+#endif
 
 /**
  * @brief Check for a "true" value.
@@ -172,6 +195,7 @@
  * @param xmin The minimum value, inclusive.
  * @param xmax The maximum value, inclusive.
  */
+#if EMBC_DBC_ENABLE
 #define EMBC_DBC_RANGE_INT(x, x_min, x_max)  do { \
     int x__ = (x); \
     int x_min__ = (x_min); \
@@ -179,6 +203,13 @@
     EMBC_DBC_ASSERT(x__ >= x_min__, #x " too small"); \
     EMBC_DBC_ASSERT(x__ <= x_max__, #x " too big"); \
 } while(0)
+#else
+#define EMBC_DBC_RANGE_INT(x, x_min, x_max)  do { \
+    (void) sizeof(x); \
+    (void) sizeof(x_min); \
+    (void) sizeof(x_max); \
+} while(0)
+#endif
 
 /**
  * @brief Assert on a value.
@@ -111,6 +111,17 @@ static inline void embc_memset(void * ptr, int value, embc_size_t num);
  */
 static inline void embc_memcpy(void * destination, void const * source, embc_size_t num);
 
+/**
+ * @brief Move data from one buffer to another.
+ *
+ * @param destination The destination buffer.
+ * @param source The source buffer.
+ * @param num The number of bytes to move.
+ *
+ * Unlike embc_memcpy(), the buffers destination and source may overlap.
+ */
+static inline void embc_memmove(void * destination, void const * source, embc_size_t num);
+
 
 /**
  * @brief The function type used by EMBC to allocate memory.
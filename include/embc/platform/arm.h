@@ -25,7 +25,7 @@
 
 #include "embc/platform.h"
 #include "embc/assert.h"
-#include <string.h>  // use memset and memcpy from the standard library
+#include <string.h>  // use memset, memcpy and memmove from the standard library
 
 EMBC_CPP_GUARD_START
 
@@ -48,6 +48,10 @@ static inline void embc_memcpy(void * destination, void const * source, embc_siz
     memcpy(destination, (void *) source, num);
 }
 
+static inline void embc_memmove(void * destination, void const * source, embc_size_t num) {
+    memmove(destination, (void *) source, num);
+}
+
 EMBC_CPP_GUARD_END
 
 /* @} */
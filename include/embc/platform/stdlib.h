@@ -26,7 +26,7 @@
 #include "embc/platform.h"
 #include "embc/assert.h"
 #include <stdlib.h>
-#include <string.h> // memcpy, memset
+#include <string.h> // memcpy, memmove, memset
 
 EMBC_CPP_GUARD_START
 
@@ -86,6 +86,10 @@ static inline void embc_memcpy(void * destination, void const * source, embc_siz
     memcpy(destination, (void *) source, num);
 }
 
+static inline void embc_memmove(void * destination, void const * source, embc_size_t num) {
+    memmove(destination, (void *) source, num);
+}
+
 EMBC_CPP_GUARD_END
 
 /* @} */
@@ -30,18 +30,21 @@ class Alloc:
 
 ALLOC = 'embc_buffer_alloc'
 FREE = 'embc_buffer_free'
+PREFIX = 'embc_buffer_'  # common to ALLOC and FREE
+ALLOC_OFFSET = len(ALLOC) + 1
+FREE_OFFSET = len(FREE) + 1
 
 
 def run():
     args = get_parser().parse_args()
     ptr_history = {}
     buffers = {}
-    line_num = 0
-    for line in args.logfile:
-        line_num += 1
+    for line_num, line in enumerate(args.logfile, 1):
+        if PREFIX not in line:
+            continue
         alloc_idx = line.find(ALLOC)
         if alloc_idx >= 0:
-            ptr = line[alloc_idx + len(ALLOC) + 1:-1]
+            ptr = sys.intern(line[alloc_idx + ALLOC_OFFSET:-1])
             b = buffers.get(ptr)
             if b is not None:
                 print('line %d: alloc without free: %s' % (line_num, b))
@@ -51,7 +54,7 @@ def run():
             continue
         free_idx = line.find(FREE)
         if free_idx >= 0:
-            ptr = line[free_idx + len(FREE) + 1:-1]
+            ptr = sys.intern(line[free_idx + FREE_OFFSET:-1])
             b = buffers.get(ptr)
             if b is None:
                 b = ptr_history.get(ptr)
@@ -14,7 +14,6 @@ import sys
 import os
 import time
 import signal
-import serial
 import logging
 log = logging.getLogger()
 
@@ -29,6 +28,7 @@ TX_PING_DEPTH = 3  # default setting
 PING_TIMEOUT = 5.0 # seconds
 PING_DEPTH = 3  # default setting
 DELAY_TIME = 1.0
+PORT0 = embc.stream.framer.Port0
 
 
 def get_parser():
@@ -47,6 +47,9 @@ def get_parser():
 
 class PingFrame:
 
+    __slots__ = ('message_id_raw', 'message_id', 'payload',
+                 'response_received', 'tx_done_received', 'time')
+
     def __init__(self, message_id, payload):
         self.message_id_raw = message_id
         self.message_id = message_id & 0xff
@@ -69,6 +72,7 @@ class PingFrameGenerator:
         self.payload_size = 240
         assert(0 == (self.payload_size % 4))
         self._pattern = embc.PatternTx()
+        self._buffer = embc.allocate_pattern_buffer(self.payload_size // 4)
 
     def is_done(self):
         if self._count_total < 0:
@@ -86,15 +90,9 @@ class PingFrameGenerator:
         return self.next()
 
     def next(self):
-        payload = []
-        for k in range(0, self.payload_size, 4):
-            word = self._pattern.next_u32()
-            word_bytes = [word & 0xff,
-                          (word >> 8) & 0xff,
-                          (word >> 16) & 0xff,
-                          (word >> 24) & 0xff]
-            payload.extend(word_bytes)
-        payload = bytes(payload)
+        # fill all words in one native call, little-endian on supported hosts
+        self._pattern.next_buffer(self._buffer)
+        payload = bytes(self._buffer)
         frame = PingFrame(self._count_generated, payload)
         self._count_generated += 1
         return frame
@@ -106,6 +104,8 @@ class PingQueue:
         self.count = count
         self._generator = PingFrameGenerator(count)
         self._queue = []
+        self._tx_done_pending = 0
+        self._rx_pending = 0
         self._time_start = None
         self._time_last = None
         self._send = send
@@ -116,8 +116,9 @@ class PingQueue:
         self._frames_timeout = 0
         self._delay = time.time()
 
-    def log_running_stats(self):
-        t = time.time()
+    def log_running_stats(self, t=None):
+        if t is None:
+            t = time.time()
         dt = t - self._time_last
         if dt > 1.0:
             frames = self._frames_completed - self._frames_completed_last
@@ -144,6 +145,8 @@ class PingQueue:
                  self._frames_timeout)
 
     def process(self):
+        if not self._queue and self._generator.is_done():
+            return  # nothing outstanding and nothing left to send
         queue = []
         t = time.time()
         if self._time_start is None:
@@ -155,12 +158,13 @@ class PingQueue:
             elif t - msg.time >= PING_TIMEOUT:
                 log.info('remove frame due to timeout')
                 self._frames_timeout += 1
+                self._discard(msg)
                 continue
             else:
                 queue.append(msg)
         self._queue = queue
 
-        if time.time() >= self._delay:
+        if t >= self._delay:
             rx_available = RX_PING_DEPTH - self._rx_pending_count()
             tx_available = TX_PING_DEPTH - self._tx_done_pending_count()
             available = min(rx_available, tx_available)
@@ -171,14 +175,23 @@ class PingQueue:
                     msg = self._generator.next()
                     msg.time = t
                     self._queue.append(msg)
+                    self._tx_done_pending += 1
+                    self._rx_pending += 1
                     self._send(msg)
-        self.log_running_stats()
+        self.log_running_stats(t)
 
     def _tx_done_pending_count(self):
-        return len([msg for msg in self._queue if not msg.tx_done_received])
+        return self._tx_done_pending
 
     def _rx_pending_count(self):
-        return len([msg for msg in self._queue if not msg.response_received])
+        return self._rx_pending
+
+    def _discard(self, msg):
+        """Update the pending counts for a frame removed from the queue."""
+        if not msg.tx_done_received:
+            self._tx_done_pending -= 1
+        if not msg.response_received:
+            self._rx_pending -= 1
 
     def _ping_rx_resync(self, message_id, data):
         for idx in range(len(self._queue)):
@@ -186,6 +199,8 @@ class PingQueue:
             if msg.message_id == message_id and msg.payload == data:
                 log.info('resync message_id=%d to index %d', message_id, idx)
                 self._frames_missing += idx
+                for m in self._queue[:idx]:
+                    self._discard(m)
                 del self._queue[:idx]
                 return msg
         log.warning('rx resync failed message_id=%d (frame from previous ping session?)',
@@ -194,7 +209,7 @@ class PingQueue:
 
     def rx(self, message_id, payload):
         if 0 == self._rx_pending_count(): # error
-            log.warning("rx ping response %d, but not expected" % message_id)
+            log.warning("rx ping response %d, but not expected", message_id)
             return
         msg = self._queue[0]
         if msg.message_id != message_id:
@@ -207,7 +222,9 @@ class PingQueue:
         else:
             log.debug('rx ping response %d', message_id)
         if msg is not None:
-            msg.response_received = True
+            if not msg.response_received:
+                msg.response_received = True
+                self._rx_pending -= 1
             self.process()
 
     def _get_tx_done_message(self, message_id):
@@ -222,11 +239,12 @@ class PingQueue:
             log.warning('tx_done ping %d with no matching tx message', message_id)
             return
         msg.tx_done_received = True
+        self._tx_done_pending -= 1
         if 0 == status:
             log.debug('tx_done ping %d', message_id)
         else:  # error
             self._frames_tx_error += 1
-            self._queue.pop(idx)
+            self._discard(self._queue.pop(idx))
             log.info('tx_done ping error %s: message_id=%d, tx_done_pending=%s, rx_pending=%d',
                      embc.ec.num_to_name.get(status, 'unknown'), message_id,
                      self._tx_done_pending_count(),
@@ -239,46 +257,63 @@ class PingQueue:
 class MasterFramer:
 
     def __init__(self, port, baudrate):
+        import serial  # deferred so that --help works without pyserial
         # port=None defers open until explict open().
         self._serial = serial.Serial(port=None, baudrate=baudrate, timeout=0.002)
         self._serial.port = port
         self._last_time = None
+        self._status_last = None
         self._framer = embc.stream.framer.Framer()
         self._framer.hal_tx = self._serial.write
         self.message_id = 0
-        self._ping = PingQueue(0, self._send_ping)
+        self._ping = None
+        self._ping_set(PingQueue(0, self._send_ping))
         self._framer.register_port(0, self.rx_port0, self.tx_done_port0)
         for i in range(1, 16):
             self._framer.register_port(i, self.rx, self.tx_done)
 
     def _send_ping(self, msg):
-        self._framer.send(0, msg.message_id, embc.stream.framer.Port0.PING_REQ, msg.payload)
+        self._framer.send(0, msg.message_id, PORT0.PING_REQ, msg.payload)
+
+    def _ping_set(self, ping):
+        """Set the ping queue and bind it into the port 0 handler tables."""
+        self._ping = ping
+        # port 0 handlers indexed directly by port_def
+        rx_port0 = [None] * 8
+        rx_port0[PORT0.PING_RSP] = ping.rx
+        rx_port0[PORT0.STATUS_RSP] = self._port0_ignore
+        self._rx_port0 = tuple(rx_port0)
+        tx_done_port0 = [None] * 8
+        tx_done_port0[PORT0.PING_REQ] = ping.tx_done
+        tx_done_port0[PORT0.RESYNC] = self._port0_ignore
+        tx_done_port0[PORT0.STATUS_REQ] = self._port0_ignore
+        self._tx_done_port0 = tuple(tx_done_port0)
 
     def start_ping(self, count):
-        self._ping = PingQueue(count, self._send_ping)
+        self._ping_set(PingQueue(count, self._send_ping))
         self._ping.process()
 
     def rx_port0(self, port, message_id, port_def, data):
-        if embc.stream.framer.Port0.PING_RSP == port_def:
-            self._ping.rx(message_id, data)
-        elif embc.stream.framer.Port0.STATUS_RSP == port_def:
-            pass
-        else:
+        fn = self._rx_port0[port_def] if port_def < len(self._rx_port0) else None
+        if fn is None:
             log.info('rx_port0 message_id=%d port_def=0x%04x', message_id, port_def)
+        else:
+            fn(message_id, data)
 
     def tx_done_port0(self, port, message_id, port_def, status):
-        if embc.stream.framer.Port0.PING_REQ == port_def:
-            self._ping.tx_done(message_id, status)
-        elif embc.stream.framer.Port0.RESYNC == port_def:
-            pass
-        elif embc.stream.framer.Port0.STATUS_REQ == port_def:
-            pass
-        else:
+        fn = self._tx_done_port0[port_def] if port_def < len(self._tx_done_port0) else None
+        if fn is None:
             log.info('tx_done_port0 message_id=%d port_def=0x%04x status=%d',
                      message_id, port_def, status)
+        else:
+            fn(message_id, status)
+
+    @staticmethod
+    def _port0_ignore(message_id, value):
+        pass
 
     def rx(self, port, message_id, port_def, data):
-        log.info('%s %s %s %s', port, message_id, port_def, data)
+        log.debug('%s %s %s %s', port, message_id, port_def, data)
 
     def tx_done(self, port, message_id, port_def, status):
         if status:
@@ -294,17 +329,26 @@ class MasterFramer:
         self._serial.close()
 
     def process(self):
-        b = self._serial.read()
-        if len(b):
-            self._framer.hal_rx(b)
-        self._framer.process()
-        if self._ping.count != 0:
-            self._ping.process()
+        # drain everything already received in one call, otherwise wait
+        # up to the port timeout for a single byte.
+        serial_port = self._serial
+        framer = self._framer
+        b = serial_port.read(serial_port.in_waiting or 1)
+        if b:
+            framer.hal_rx(b)
+        framer.process()
+        ping = self._ping
+        if ping.count != 0:
+            ping.process()
         else:
             t = time.time()
             if t - self._last_time > 1.0:
                 self._last_time = t
-                print(self._framer.status)
+                status = framer.status
+                status_raw = bytes(status)
+                if status_raw != self._status_last:
+                    self._status_last = status_raw
+                    print(status)
 
 
 def run():
@@ -324,8 +368,9 @@ def run():
     print('start')
     if args.ping != 0:
         framer.start_ping(args.ping)
+    process = framer.process
     while not quit:
-        framer.process()
+        process()
     framer.close()
     print('stop')
 
@@ -1,9 +1,6 @@
 # Copyright 2017 Jetperch LLC
 
-import os
-from ctypes import cdll, Structure, POINTER, pointer, cast, \
-    c_uint64, c_uint32, c_uint16, c_uint8
-from ctypes.wintypes import DWORD, HANDLE, BOOL, LPVOID, LPWSTR
+from ctypes import Structure, POINTER, pointer
 
 class embc_list_s(Structure):
     pass
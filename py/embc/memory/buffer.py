@@ -1,10 +1,8 @@
 # Copyright 2017 Jetperch LLC
 
-import os
 import ctypes
-from ctypes import cdll, Structure, POINTER, pointer, cast, \
+from ctypes import Structure, POINTER, \
     c_uint64, c_uint32, c_uint16, c_uint8, c_void_p, c_size_t, c_char_p
-from ctypes.wintypes import DWORD, HANDLE, BOOL, LPVOID, LPWSTR
 from embc.lib import dll as _dll
 from ..collections.list import embc_list_s
 
@@ -37,18 +35,21 @@ class embc_buffer_s(Structure):
         self.length = 0
 
     def read_remaining(self):
-        return bytes(self.data[self.cursor:self.length])
+        # string_at copies straight from native memory, no int list
+        return ctypes.string_at(ctypes.addressof(self.data.contents) + self.cursor,
+                                self.length - self.cursor)
 
     def read_all(self):
-        return bytes(self.data[0:self.length])
+        return ctypes.string_at(self.data, self.length)
 
     def write(self, b):
         """Append a bytes-like value
 
         :param b: The bytes-like value
         """
-        v = ctypes.create_string_buffer(b)
-        write(self, v, len(b))
+        if not isinstance(b, bytes):
+            b = bytes(b)
+        write(self, b, len(b))  # c_void_p accepts bytes without a copy
 
     def erase(self, start, end):
         erase(self, start, end)
@@ -1,9 +1,7 @@
 # Copyright 2017 Jetperch LLC
 
-import os
-from ctypes import cdll, Structure, POINTER, pointer, cast, \
+from ctypes import Structure, POINTER, pointer, memmove, \
     c_uint64, c_uint32, c_uint16, c_uint8
-from ctypes.wintypes import DWORD, HANDLE, BOOL, LPVOID, LPWSTR
 from embc.lib import dll as _dll
 
 
@@ -85,15 +83,12 @@ class PatternTx:
         self._native = embc_pattern_32a_tx_s()
         self._p = pointer(self._native)
         pattern_32a_tx_initialize(self._p)
-        pattern_32a_tx_initialize(self._p)
 
     def next_u32(self):
         return pattern_32a_tx_next(self._p)
 
     def next_buffer(self, buffer_u32):
-        p = cast(buffer_u32, POINTER(c_uint32))
-        v = len(buffer_u32) * 4
-        pattern_32a_tx_buffer(self._p, p, v)
+        pattern_32a_tx_buffer(self._p, buffer_u32, len(buffer_u32) * 4)
 
 
 class PatternRx:
@@ -101,8 +96,14 @@ class PatternRx:
     def __init__(self):
         self._native = embc_pattern_32a_rx_s()
         self._p = pointer(self._native)
+        self._scratch = allocate_pattern_buffer(0)
         pattern_32a_rx_initialize(self._p)
-        pattern_32a_rx_initialize(self._p)
+
+    def _scratch_get(self, length_words):
+        """Get the reusable scratch buffer, growing it geometrically."""
+        if len(self._scratch) < length_words:
+            self._scratch = allocate_pattern_buffer(max(length_words, 2 * len(self._scratch)))
+        return self._scratch
 
     @property
     def receive_count(self):
@@ -123,19 +124,26 @@ class PatternRx:
     def next_u32(self, data):
         pattern_32a_rx_next(self._p, c_uint32(data))
 
+    def _next_bytes(self, buffer_u32):
+        v = len(buffer_u32)
+        assert 0 == (v & 0x3)
+        z = self._scratch_get(v // 4)
+        memmove(z, buffer_u32, v)
+        pattern_32a_rx_buffer(self._p, z, v)
+
+    def _next_list(self, buffer_u32):
+        v = len(buffer_u32)
+        z = self._scratch_get(v)
+        z[:v] = buffer_u32
+        pattern_32a_rx_buffer(self._p, z, v * 4)
+
+    def _next_array(self, buffer_u32):
+        pattern_32a_rx_buffer(self._p, buffer_u32, len(buffer_u32) * 4)
+
     def next_buffer(self, buffer_u32):
         if isinstance(buffer_u32, bytes):
-            v = len(buffer_u32)
-            assert 0 == (v & 0x3)
-            z = (c_uint8 * v).from_buffer_copy(buffer_u32)
-            p = cast(z, POINTER(c_uint32))
-            pattern_32a_rx_buffer(self._p, p, v)
+            self._next_bytes(buffer_u32)
         elif isinstance(buffer_u32, list):
-            v = len(buffer_u32)
-            buffer_u32 = (c_uint32 * v)(*buffer_u32)
-            p = cast(buffer_u32, POINTER(c_uint32))
-            pattern_32a_rx_buffer(self._p, p, v * 4)
+            self._next_list(buffer_u32)
         else:  # presume ctypes.c_uint32 * k
-            p = cast(buffer_u32, POINTER(c_uint32))
-            v = len(buffer_u32) * 4
-            pattern_32a_rx_buffer(self._p, p, v)
+            self._next_array(buffer_u32)
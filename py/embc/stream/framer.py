@@ -1,14 +1,10 @@
 # Copyright 2017 Jetperch LLC
 
-import os
-import ctypes
-from ctypes import cdll, Structure, POINTER, pointer, cast, CFUNCTYPE, \
+from ctypes import Structure, POINTER, pointer, CFUNCTYPE, \
     c_int64, c_uint32, c_uint16, c_uint8, c_void_p, c_size_t, c_char_p, \
     c_int32
-from ctypes.wintypes import DWORD, HANDLE, BOOL, LPVOID, LPWSTR
 from embc.lib import dll as _dll
 from embc import lib as embc_lib
-from ..collections.list import embc_list_s
 from ..memory import buffer as embc_buffer
 import time
 import logging
@@ -20,6 +16,7 @@ RX_FN = CFUNCTYPE(None, c_void_p, c_uint8, c_uint8, c_uint16, POINTER(embc_buffe
 TX_DONE_FN = CFUNCTYPE(None, c_void_p, c_uint8, c_uint8, c_uint16, c_int32)
 MAX_RETRIES = 16
 TIMER_ID = 42
+PORTS = 16  # EMBC_FRAMER_PORTS
 
 
 class Port0:
@@ -43,12 +40,12 @@ class embc_framer_status_s(Structure):
         ('tx_count', c_uint32),
         ('tx_retransmit_count', c_uint32),
     ]
-    
+    _str_fields = tuple(field for field, _ in _fields_)
+    _str_format = 'embc_framer_status_s(%s)' % (
+        ', '.join('%s=%%s' % field for field in _str_fields))
+
     def __str__(self):
-        fields = []
-        for field, _ in self._fields_:
-            fields.append('%s=%s' % (field, getattr(self, field)))
-        return 'embc_framer_status_s(%s)' % (', '.join(fields))
+        return self._str_format % tuple(getattr(self, field) for field in self._str_fields)
 
 
 class embc_framer_port_callbacks_s(Structure):
@@ -109,7 +106,7 @@ hal_rx_byte.argtypes = [c_void_p, c_uint8]
 #        uint8_t const * buffer, embc_size_t length);
 hal_rx_buffer = _dll.embc_framer_hal_rx_buffer
 hal_rx_buffer.restype = None
-hal_rx_buffer.argtypes = [c_void_p, POINTER(c_uint8), c_size_t]
+hal_rx_buffer.argtypes = [c_void_p, c_char_p, c_size_t]
 
 # void embc_framer_hal_tx_done(
 #        struct embc_framer_s * self,
@@ -132,7 +129,7 @@ send.argtypes = [c_void_p, c_uint8, c_uint8, c_uint16, POINTER(embc_buffer_s)]
 #        uint8_t const * data, uint8_t length);
 send_payload = _dll.embc_framer_send_payload
 send_payload.restype = None
-send_payload.argtypes = [c_void_p, c_uint8, c_uint8, c_uint16, POINTER(c_uint8), c_uint8]
+send_payload.argtypes = [c_void_p, c_uint8, c_uint8, c_uint16, c_char_p, c_uint8]
 
 # void embc_framer_resync(struct embc_framer_s * self)
 resync = _dll.embc_framer_resync
@@ -156,6 +153,14 @@ def _timer_cbk_default(user_data, timer_id):
     pass
 
 
+def _rx_unregistered(port, message_id, port_def, data):
+    log.warning('rx port=%d, but no registered callback', port)
+
+
+def _tx_done_unregistered(port, message_id, port_def, status):
+    log.warning('tx_done port=%d, but no registered callback', port)
+
+
 timer_cbk_default = TIMER_DONE_FN(_timer_cbk_default)
 
 
@@ -169,7 +174,8 @@ class Framer:
         self.time_offset = time.time()  # seconds
         self.timeout = None  # seconds
         self.hal_tx = lambda x: None
-        self._pyport = [[None, None]] * 256
+        self._rx = [_rx_unregistered] * PORTS
+        self._tx_done = [_tx_done_unregistered] * PORTS
 
         # define HAL callbacks
         self.__hal_tx = HAL_TX_FN(self._hal_tx)
@@ -192,8 +198,6 @@ class Framer:
         sz = instance_size()
         self.framer = embc_lib.alloc(sz)
         initialize(self.framer, self.allocator, pointer(self._hal))
-        for i in range(0, 16):
-            register_port_callbacks(self.framer, i, pointer(self._cport))
         self._timer_cbk_reset()
 
     def _timer_cbk_reset(self):
@@ -210,10 +214,9 @@ class Framer:
         return status_get(self.framer)
 
     def hal_rx(self, buffer_bytes):
-        payload_len = len(buffer_bytes)
-        msg_char = ctypes.create_string_buffer(buffer_bytes)
-        msg = cast(msg_char, POINTER(c_uint8))
-        hal_rx_buffer(self.framer, msg, payload_len)
+        if not isinstance(buffer_bytes, bytes):
+            buffer_bytes = bytes(buffer_bytes)
+        hal_rx_buffer(self.framer, buffer_bytes, len(buffer_bytes))
 
     def _hal_tx(self, user_data, buffer):
         self.hal_tx(buffer[0].read_all())
@@ -240,37 +243,42 @@ class Framer:
         return 0
 
     def _port_rx(self, user_data, port, message_id, port_def, buffer):
-        rx, _ = self._pyport[port]
-        data = buffer[0].read_remaining()
-        buffer[0].free()
-        if rx is None:
-            log.warning('rx port=%d, but no registered callback', port)
-        else:
-            rx(port, message_id, port_def, data)
+        rx = self._rx[port]
+        b = buffer.contents
+        data = b.read_remaining()
+        b.free()
+        rx(port, message_id, port_def, data)
 
     def _port_tx_done(self, user_data, port, message_id, port_def, status):
-        _, tx_done = self._pyport[port]
-        if tx_done is None:
-            log.warning('tx_done port=%d, but no registered callback', port)
-        else:
-            tx_done(port, message_id, port_def, status)
+        self._tx_done[port](port, message_id, port_def, status)
 
     def register_port(self, port, rx, tx_done):
         """Register callbacks for a port
 
-        :param port: The port number from 1 to EMBC_FRAMER_PORTS.
+        :param port: The port number from 0 to EMBC_FRAMER_PORTS - 1.
         :param rx: The callable(port, message_id, port_def, data)
         :param tx_done: The callable(port, message_id, port_def, status).
+        :raise ValueError: If port is out of range.
         """
-        port = int(port)
-        assert(0 <= port < 256)
-        self._pyport[port] = (rx, tx_done)
+        if type(port) is not int:
+            port = int(port)
+        if port & ~(PORTS - 1):  # PORTS is a power of 2
+            raise ValueError('invalid port %r' % port)
+        self._rx[port] = rx if rx is not None else _rx_unregistered
+        self._tx_done[port] = tx_done if tx_done is not None else _tx_done_unregistered
+        # Only route registered ports into Python, unregistered ports
+        # use the native default callbacks.
+        if rx is None and tx_done is None:
+            cport = embc_framer_port_callbacks_s()
+        else:
+            cport = self._cport
+        register_port_callbacks(self.framer, port, pointer(cport))
 
     def send(self, port, message_id, port_def, payload):
-        payload_len = len(payload)
-        msg_char = ctypes.create_string_buffer(payload)
-        msg = cast(msg_char, POINTER(c_uint8))
-        send_payload(self.framer, port, message_id, port_def, msg, payload_len)
+        if not isinstance(payload, bytes):
+            payload = bytes(payload)
+        # c_char_p passes the bytes storage directly without a copy
+        send_payload(self.framer, port, message_id, port_def, payload, len(payload))
 
     def resync(self):
         resync(self.framer)
@@ -279,7 +287,7 @@ class Framer:
         if self.timeout is None:
             return
         if self.current_time > self.timeout:
-            log.info('timeout')
+            log.debug('timeout')
             cbk_fn, cbk_user_data = self._timer_cbk
             self._timer_cbk_reset()
             cbk_fn(cbk_user_data, TIMER_ID)
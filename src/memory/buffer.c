@@ -345,9 +345,7 @@ void embc_buffer_erase(struct embc_buffer_s * buffer,
     EMBC_DBC_RANGE_INT(end, 0, buffer->length);
     embc_size_t length = end - start;
     if (length > 0) {
-        for (embc_size_t k = start; k < (buffer->length - length); ++k) {
-            buffer->data[k] = buffer->data[k + length];
-        }
+        embc_memmove(buffer->data + start, buffer->data + end, buffer->length - end);
         if (buffer->cursor >= end) {
             buffer->cursor -= length;
         } else if (buffer->cursor > start) {
@@ -96,7 +96,7 @@ int embc_pool_is_empty(struct embc_pool_s * self) {
 
 void * embc_pool_alloc(struct embc_pool_s * self) {
     EMBC_DBC_NOT_NULL(self);
-    EMBC_DBC_NOT_NULL(self->free_head);
+    EMBC_ASSERT_ALLOC(self->free_head);
     struct embc_pool_element_s * hdr = self->free_head;
     LL_DELETE(self->free_head, hdr);
     return ((void *) (hdr + 1));
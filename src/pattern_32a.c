@@ -17,6 +17,7 @@
 #include "embc/pattern_32a.h"
 #include "embc/assert.h"
 #include "embc/dbc.h"
+#include "embc/platform.h"
 #include <stdbool.h>
 
 #define TOGGLE_SHIFT ((uint8_t) 0)
@@ -86,22 +87,26 @@ void embc_pattern_32a_tx_buffer(
         uint32_t * buffer,
         uint32_t size) {
     uint32_t sz = size / 4;
-    uint32_t counter_offset = 1;
-    uint32_t shift_offset = 0;
-    if (TOGGLE_COUNT == self->toggle) {
-        counter_offset = 0;
-        shift_offset = 1;
-    }
-    for (uint32_t i = counter_offset; i < sz; i += 2) {
-        buffer[i] = peek_counter_(self);
-        advance_counter_(self);
-    }
-    for (uint32_t i = shift_offset; i < sz; i += 2) {
-        buffer[i] = peek_shift_(self);
-        advance_shift_(self);
+    uint32_t i = 0;
+    // single pass over the buffer, one word pair per iteration
+    if (TOGGLE_SHIFT == self->toggle) {
+        for (; (i + 1) < sz; i += 2) {
+            buffer[i] = peek_shift_(self);
+            advance_shift_(self);
+            buffer[i + 1] = peek_counter_(self);
+            advance_counter_(self);
+        }
+    } else {
+        for (; (i + 1) < sz; i += 2) {
+            buffer[i] = peek_counter_(self);
+            advance_counter_(self);
+            buffer[i + 1] = peek_shift_(self);
+            advance_shift_(self);
+        }
     }
-    if (sz & 1) {
-        self->toggle = (TOGGLE_SHIFT == self->toggle) ? TOGGLE_COUNT : TOGGLE_SHIFT;
+    if (i < sz) {
+        buffer[i] = peek_(self);
+        advance_(self);
     }
 }
 
@@ -128,14 +133,9 @@ static bool is_counter_value(uint32_t value) {
     return (((~value) >> 16) == (value & 0xffff));
 }
 
-static uint8_t shift_position(uint32_t shift) {
-    // CLZ instruction would be much faster
-    uint8_t position = 0;
-    while (shift != 0) {
-        shift = shift >> 1U;
-        ++position;
-    }
-    return position;
+static inline uint8_t shift_position(uint32_t shift) {
+    // 1-based index of the set bit, 0 when no bit is set
+    return (uint8_t) (32 - embc_clz(shift));
 }
 
 /**
@@ -250,7 +250,22 @@ void embc_pattern_32a_rx_buffer(
     EMBC_DBC_NOT_NULL(self);
     EMBC_DBC_NOT_NULL(buffer);
     uint32_t sz = size / 4;
-    for (uint32_t i = 0; i < sz; ++i) {
-        embc_pattern_32a_rx_next(self, buffer[i]);
+    uint32_t i = 0;
+    while (i < sz) {
+        if (ST_SYNC == self->state) {
+            // fast path: match the expected pattern until the first mismatch
+            struct embc_pattern_32a_tx_s tx = self->tx;
+            uint32_t start = i;
+            while ((i < sz) && (buffer[i] == peek_(&tx))) {
+                advance_(&tx);
+                ++i;
+            }
+            self->tx = tx;
+            self->receive_count += i - start;
+            if (i >= sz) {
+                break;
+            }
+        }
+        embc_pattern_32a_rx_next(self, buffer[i++]);
     }
 }
@@ -120,6 +120,7 @@ struct embc_framer_s {
     struct embc_list_s tx_buffers_free;    // of embc_buffer_s, for retransmission
     struct embc_list_s tx_buffers_active;  // of embc_buffer_s, for retransmission
     struct embc_list_s tx_queue;           // of embc_buffer_s, awaiting transmission
+    struct tx_buf_s * tx_frame_id_map[EMBC_FRAMER_ID_MASK + 1];  // active tx_buf_s by frame_id
 };
 
 embc_size_t embc_framer_instance_size(void) {
@@ -429,21 +430,16 @@ static uint8_t expected_tx_frame_id(struct embc_framer_s * self) {
 }
 
 static struct tx_buf_s * find_tx(struct embc_framer_s * self, uint8_t frame_id) {
-    struct embc_list_s * item;
-    embc_list_foreach(&self->tx_buffers_active, item) {
-        struct tx_buf_s * t = embc_list_entry(item, struct tx_buf_s, item);
-        struct embc_framer_header_s *hdr = buffer_hdr(t->b);
-        if (hdr->frame_id == frame_id) {
-            return t;
-        }
-    }
-    return 0;
+    return self->tx_frame_id_map[frame_id & EMBC_FRAMER_ID_MASK];
 }
 
 static void tx_complete(struct embc_framer_s * self, struct tx_buf_s * t, uint8_t status) {
     struct embc_framer_header_s hdr = *buffer_hdr(t->b);
     EMBC_LOGD2("tx_complete %p, port=%d, status=%d", (void *) t->b, (int) hdr.port, (int) status);
     ++self->status.tx_count;
+    if (self->tx_frame_id_map[hdr.frame_id & EMBC_FRAMER_ID_MASK] == t) {
+        self->tx_frame_id_map[hdr.frame_id & EMBC_FRAMER_ID_MASK] = 0;
+    }
     embc_buffer_free(t->b);
     t->b = 0;
     t->status = TX_STATUS_EMPTY;
@@ -587,6 +583,7 @@ static void transmit_queued(struct embc_framer_s * self) {
         embc_list_add_tail(&self->tx_buffers_active, item);
         t->b = b;
         t->retries = 0;
+        self->tx_frame_id_map[buffer_hdr(b)->frame_id & EMBC_FRAMER_ID_MASK] = t;
         transmit_tx_buf(self, t);
     }
 }
@@ -838,8 +835,7 @@ static void framer_resync(struct embc_framer_s * self, int32_t status) {
     embc_buffer_erase(self->rx_buffer, 0, i);
 }
 
-void embc_framer_hal_rx_byte(struct embc_framer_s * self, uint8_t byte) {
-    EMBC_DBC_NOT_NULL(self);
+static inline void rx_byte(struct embc_framer_s * self, uint8_t byte) {
     embc_buffer_write_u8(self->rx_buffer, byte);
 
     switch (self->rx_state) {
@@ -896,13 +892,18 @@ void embc_framer_hal_rx_byte(struct embc_framer_s * self, uint8_t byte) {
     }
 }
 
+void embc_framer_hal_rx_byte(struct embc_framer_s * self, uint8_t byte) {
+    EMBC_DBC_NOT_NULL(self);
+    rx_byte(self, byte);
+}
+
 void embc_framer_hal_rx_buffer(struct embc_framer_s * self,
         uint8_t const * buffer, embc_size_t length) {
     EMBC_DBC_NOT_NULL(self);
     if (length > 0) {
         EMBC_DBC_NOT_NULL(buffer);
         for (embc_size_t i = 0; i < length; ++i) {
-            embc_framer_hal_rx_byte(self, buffer[i]);
+            rx_byte(self, buffer[i]);
         }
     }
 }
@@ -912,18 +913,15 @@ void embc_framer_hal_tx_done(
         struct embc_buffer_s * buffer) {
     EMBC_DBC_NOT_NULL(self);
     EMBC_DBC_NOT_NULL(buffer);
-    struct embc_list_s * item;
     struct embc_framer_header_s * hdr = buffer_hdr(buffer);
     if (EMBC_FRAMER_TYPE_ACK == (hdr->frame_id & EMBC_FRAMER_TYPE_MASK)) {
         EMBC_LOGD3("embc_framer_hal_tx_done ack %d %p", hdr->frame_id, (void *) buffer);
         embc_buffer_free(buffer);
     } else {
         EMBC_LOGD3("embc_framer_hal_tx_done data %d %p", hdr->frame_id, (void *) buffer);
-        embc_list_foreach(&self->tx_buffers_active, item) {
-            struct tx_buf_s *t = embc_list_entry(item, struct tx_buf_s, item);
-            if (t->b == buffer) {
-                t->status = TX_STATUS_AWAIT_ACK;
-            }
+        struct tx_buf_s * t = find_tx(self, hdr->frame_id);
+        if (t && (t->b == buffer)) {
+            t->status = TX_STATUS_AWAIT_ACK;
         }
     }
 }
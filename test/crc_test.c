@@ -62,6 +62,24 @@ static void crc_ccitt_8_invalid_args(void **state) {
     assert_int_equal(0x00000000, embc_crc_ccitt_8(0, MSG_00, 0));
 }
 
+static uint8_t crc_ccitt_8_bitwise(uint8_t crc, uint8_t byte) {
+    crc = ~crc ^ byte;
+    for (int j = 0; j < 8; ++j) {
+        crc = (crc & 1) ? ((crc >> 1) ^ 0xE0) : (crc >> 1);
+    }
+    return ~crc;
+}
+
+static void crc_ccitt_8_all_bytes(void **state) {
+    (void) state;
+    uint8_t byte;
+    for (int i = 0; i < 256; ++i) {
+        byte = (uint8_t) i;
+        assert_int_equal(crc_ccitt_8_bitwise(0, byte), embc_crc_ccitt_8(0, &byte, 1));
+        assert_int_equal(crc_ccitt_8_bitwise(0x5a, byte), embc_crc_ccitt_8(0x5a, &byte, 1));
+    }
+}
+
 static void crc_ccitt_16_well_known(void **state) {
     (void) state;
     assert_int_equal(0x7b3f, embc_crc_ccitt_16(0, MSG0, sizeof(MSG0)));
@@ -112,11 +130,39 @@ static void crc32_invalid_args(void **state) {
     assert_int_equal(0x00000000, embc_crc32(0, MSG_00, 0));
 }
 
+static uint32_t crc32_bitwise(uint32_t crc, uint8_t const *data, uint32_t length) {
+    crc = ~crc;
+    for (uint32_t i = 0; i < length; ++i) {
+        crc ^= data[i];
+        for (int j = 0; j < 8; ++j) {
+            crc = (crc & 1) ? ((crc >> 1) ^ 0xEDB88320) : (crc >> 1);
+        }
+    }
+    return ~crc;
+}
+
+static void crc32_long_unaligned(void **state) {
+    (void) state;
+    uint8_t data[1031];
+    for (uint32_t i = 0; i < sizeof(data); ++i) {
+        data[i] = (uint8_t) (i * 7 + 3);
+    }
+    for (uint32_t offset = 0; offset < 4; ++offset) {
+        uint32_t length = sizeof(data) - offset;
+        uint32_t expect = crc32_bitwise(0, data + offset, length);
+        assert_int_equal(expect, embc_crc32(0, data + offset, length));
+        uint32_t crc = embc_crc32(0, data + offset, 5);
+        crc = embc_crc32(crc, data + offset + 5, length - 5);
+        assert_int_equal(expect, crc);
+    }
+}
+
 int main(void) {
     const struct CMUnitTest tests[] = {
             cmocka_unit_test(crc_ccitt_8_well_known),
             cmocka_unit_test(crc_ccitt_8_incremental),
             cmocka_unit_test(crc_ccitt_8_invalid_args),
+            cmocka_unit_test(crc_ccitt_8_all_bytes),
 
             cmocka_unit_test(crc_ccitt_16_well_known),
             cmocka_unit_test(crc_ccitt_16_incremental),
@@ -125,6 +171,7 @@ int main(void) {
             cmocka_unit_test(crc32_well_known),
             cmocka_unit_test(crc32_incremental),
             cmocka_unit_test(crc32_invalid_args),
+            cmocka_unit_test(crc32_long_unaligned),
     };
 
     return cmocka_run_group_tests(tests, NULL, NULL);
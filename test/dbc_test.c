@@ -22,17 +22,23 @@
 #include "embc.h"
 #include "hal_test_impl.h"
 
+#if EMBC_DBC_ENABLE
+#define expect_dbc_failure(x) expect_assert_failure(x)
+#else
+#define expect_dbc_failure(x)  // checks compiled out
+#endif
+
 
 static void test_true(void **state) {
     (void) state;
     EMBC_DBC_TRUE(1);
-    expect_assert_failure(EMBC_DBC_TRUE(0));
+    expect_dbc_failure(EMBC_DBC_TRUE(0));
 }
 
 static void test_false(void **state) {
     (void) state;
     EMBC_DBC_FALSE(0);
-    expect_assert_failure(EMBC_DBC_FALSE(1));
+    expect_dbc_failure(EMBC_DBC_FALSE(1));
 }
 
 static void test_not_null(void **state) {
@@ -40,49 +46,49 @@ static void test_not_null(void **state) {
     int x = 0;
     int * p = &x;
     EMBC_DBC_NOT_NULL(p);
-    expect_assert_failure(EMBC_DBC_NOT_NULL(0));
+    expect_dbc_failure(EMBC_DBC_NOT_NULL(0));
 }
 
 static void test_equal(void **state) {
     (void) state;
     EMBC_DBC_EQUAL(42, 42);
-    expect_assert_failure(EMBC_DBC_EQUAL(1, 2));
+    expect_dbc_failure(EMBC_DBC_EQUAL(1, 2));
 }
 
 static void test_gte_zero(void **state) {
     (void) state;
     EMBC_DBC_GTE_ZERO(0);
     EMBC_DBC_GTE_ZERO(100);
-    expect_assert_failure(EMBC_DBC_GTE_ZERO(-1));
+    expect_dbc_failure(EMBC_DBC_GTE_ZERO(-1));
 }
 
 static void test_gt_zero(void **state) {
     (void) state;
     EMBC_DBC_GT_ZERO(1);
     EMBC_DBC_GT_ZERO(100);
-    expect_assert_failure(EMBC_DBC_GT_ZERO(0));
+    expect_dbc_failure(EMBC_DBC_GT_ZERO(0));
 }
 
 static void test_lte_zero(void **state) {
     (void) state;
     EMBC_DBC_LTE_ZERO(0);
     EMBC_DBC_LTE_ZERO(-100);
-    expect_assert_failure(EMBC_DBC_LTE_ZERO(1));
+    expect_dbc_failure(EMBC_DBC_LTE_ZERO(1));
 }
 
 static void test_lt_zero(void **state) {
     (void) state;
     EMBC_DBC_LT_ZERO(-1);
     EMBC_DBC_LT_ZERO(-100);
-    expect_assert_failure(EMBC_DBC_LT_ZERO(0));
+    expect_dbc_failure(EMBC_DBC_LT_ZERO(0));
 }
 
 static void test_range_int(void **state) {
     (void) state;
     EMBC_DBC_RANGE_INT(-10, -10, 20);
     EMBC_DBC_RANGE_INT(20, -10, 20);
-    expect_assert_failure(EMBC_DBC_RANGE_INT(-11, -10, 20));
-    expect_assert_failure(EMBC_DBC_RANGE_INT(21, -10, 20));
+    expect_dbc_failure(EMBC_DBC_RANGE_INT(-11, -10, 20));
+    expect_dbc_failure(EMBC_DBC_RANGE_INT(21, -10, 20));
 }
 
 int main(void) {
@@ -19,6 +19,7 @@
 #include <setjmp.h>
 #include <cmocka.h>
 #include "embc/lfsr.h"
+#include "embc/dbc.h"
 
 
 static const uint8_t LFSR16_U8[] = {0x22, 0x47, 0x37, 0xc4, 0x9d, 0xe3, 0x15, 0x88, 0x52, 0xef, 0x16, 0x3e, 0xa1, 0x5f, 0x40, 0x41};
@@ -77,11 +78,13 @@ static void embc_lfsr_display_u16(void **state) {
 }
 */
 
+#if EMBC_DBC_ENABLE
 static void test_embc_lfsr_invalid(void **state) {
     (void) state;
     embc_lfsr_initialize(&lfsr);
     expect_assert_failure(embc_lfsr_next_u16(0));
 }
+#endif
 
 static void test_embc_lfsr_next_u8(void **state) {
     (void) state;
@@ -160,7 +163,9 @@ static void test_embc_lfsr_follow_valid(void **state) {
     int i;
     int v;
     embc_lfsr_initialize(&lfsr);
+#if EMBC_DBC_ENABLE
     expect_assert_failure(embc_lfsr_follow_u8(0, 1));
+#endif
     for (i = 0; i < 8; ++i) {
         v = embc_lfsr_follow_u8(&lfsr, LFSR16_U8[i]);
         assert_int_equal(0, v);
@@ -187,7 +192,9 @@ static void test_embc_lfsr_follow_valid_sync(void **state) {
 
 int main(void) {
     const struct CMUnitTest tests[] = {
+#if EMBC_DBC_ENABLE
             cmocka_unit_test_setup(test_embc_lfsr_invalid, setup),
+#endif
             cmocka_unit_test_setup(test_embc_lfsr_next_u8, setup),
             cmocka_unit_test_setup(test_embc_lfsr_next_u16, setup),
             cmocka_unit_test_setup(test_embc_lfsr_next_u32, setup),
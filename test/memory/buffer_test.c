@@ -20,6 +20,7 @@
 #include <setjmp.h>
 #include <cmocka.h>
 #include "embc/memory/buffer.h"
+#include "embc/dbc.h"
 #include "embc/cdef.h"
 
 embc_size_t SIZES1[] = {8, 7, 6, 5, 4, 3, 2, 1};
@@ -306,6 +307,7 @@ static void buffer_erase_cursor_before(void **state) {
     assert_memory_equal("hello world!", self->b->data, 12);
 }
 
+#if EMBC_DBC_ENABLE
 static void buffer_erase_invalid(void **state) {
     struct erase_s *self = (struct erase_s *) *state;
     embc_buffer_write_str(self->b, "hello good world!");
@@ -315,6 +317,7 @@ static void buffer_erase_invalid(void **state) {
     expect_assert_failure(embc_buffer_erase(self->b, 6, -1));
     expect_assert_failure(embc_buffer_erase(self->b, -1, 6));
 }
+#endif
 
 static void buffer_erase_all(void **state) {
     struct erase_s *self = (struct erase_s *) *state;
@@ -372,7 +375,9 @@ int main(void) {
             cmocka_unit_test_setup_teardown(buffer_erase_cursor_at_end, setup_erase, teardown_erase),
             cmocka_unit_test_setup_teardown(buffer_erase_cursor_in_middle, setup_erase, teardown_erase),
             cmocka_unit_test_setup_teardown(buffer_erase_cursor_before, setup_erase, teardown_erase),
+#if EMBC_DBC_ENABLE
             cmocka_unit_test_setup_teardown(buffer_erase_invalid, setup_erase, teardown_erase),
+#endif
             cmocka_unit_test_setup_teardown(buffer_erase_all, setup_erase, teardown_erase),
             cmocka_unit_test_setup_teardown(buffer_erase_to_length, setup_erase, teardown_erase),
             cmocka_unit_test(buffer_static_declare),
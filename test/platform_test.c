@@ -36,10 +36,22 @@ static void test_clz_individual_bits(void **state) {
     }
 }
 
+static void test_memmove_overlap(void **state) {
+    (void) state;
+    uint8_t data[] = {0, 1, 2, 3, 4, 5, 6, 7};
+    uint8_t const expect_down[] = {2, 3, 4, 5, 6, 7, 6, 7};
+    uint8_t const expect_up[] = {2, 3, 2, 3, 4, 5, 6, 7};
+    embc_memmove(data, data + 2, 6);
+    assert_memory_equal(expect_down, data, sizeof(data));
+    embc_memmove(data + 2, data, 6);
+    assert_memory_equal(expect_up, data, sizeof(data));
+}
+
 int main(void) {
     const struct CMUnitTest tests[] = {
             cmocka_unit_test(test_clz_extremes),
             cmocka_unit_test(test_clz_individual_bits),
+            cmocka_unit_test(test_memmove_overlap),
     };
 
     return cmocka_run_group_tests(tests, NULL, NULL);